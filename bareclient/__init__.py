@@ -8,6 +8,7 @@ from .helpers import (
     get,
     get_text,
     get_json,
+    gather_json,
     post,
     post_text,
     post_json
@@ -29,6 +30,7 @@ __all__ = [
     'get',
     'get_text',
     'get_json',
+    'gather_json',
     'post',
     'post_text',
     'post_json',
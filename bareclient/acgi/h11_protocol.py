@@ -10,7 +10,6 @@ from typing import (
 
 import h11
 
-from .asyncio_events import MessageEvent
 from .http_protocol import HttpProtocol
 from .types import (
     HttpACGIRequest,
@@ -24,7 +23,8 @@ from .types import (
     HttpProtocolError
 )
 
-MappingMessageEvent = MessageEvent[HttpACGIResponses]
+# The end of message event carries no data, so one instance can be shared.
+_END_OF_MESSAGE = h11.EndOfMessage()
 
 
 class H11Protocol(HttpProtocol):
@@ -47,13 +47,30 @@ class H11Protocol(HttpProtocol):
         self._bufsiz = bufsiz
         self._h11_state = h11.Connection(our_role=h11.CLIENT)
         self._is_initialised = False
-        self._connection_event: MappingMessageEvent = MessageEvent()
-        self._response_event: MappingMessageEvent = MessageEvent()
+        # The connection and response messages of a cycle are received
+        # through a queue before the body is read.
+        self._control_messages: asyncio.Queue[HttpACGIResponses] = (
+            asyncio.Queue()
+        )
+        self._pending_control_messages = 0
+        self._response_task: Optional[asyncio.Task[None]] = None
         self._is_message_ended = True
 
+    @property
+    def is_reusable(self) -> bool:
+        if not super().is_reusable:
+            return False
+        # Both sides must have completed the last request/response cycle for
+        # the connection to start another.
+        return not self._is_initialised or (
+            self._h11_state.our_state is h11.DONE and
+            self._h11_state.their_state is h11.DONE
+        )
+
     def _connect(self) -> None:
         if self._is_initialised:
             self._h11_state.start_next_cycle()
+        self._pending_control_messages = 2
         self._is_message_ended = False
 
     async def send(self, message: HttpACGIRequests) -> None:
@@ -71,13 +88,15 @@ class H11Protocol(HttpProtocol):
 
     async def receive(self) -> HttpACGIResponses:
 
-        message = await self._connection_event.wait_with_message()
-        if message is not None:
-            return message
-
-        message = await self._response_event.wait_with_message()
-        if message is not None:
-            return message
+        if self._pending_control_messages:
+            self._pending_control_messages -= 1
+            if (
+                    not self._pending_control_messages and
+                    self._response_task is not None
+            ):
+                # Awaiting the task raises any error reading the response.
+                await self._response_task
+            return await self._control_messages.get()
 
         message = await self._receive_body_event()
         return message
@@ -92,47 +111,60 @@ class H11Protocol(HttpProtocol):
         request = h11.Request(
             method=method,
             target=message['path'],
-            headers=message.get('headers', [])
+            headers=message['headers']
         )
 
-        buf = self._h11_state.send(request)
-        assert buf is not None, "A request should always have data"
-        self.writer.write(buf)
-        await self.writer.drain()
+        data = self._h11_state.send(request)
+        assert data is not None, "A request should always have data"
+
+        # Send the request head with the first part of the body.
+        await self._send_request_data(
+            message['body'],
+            message['more_body'],
+            data
+        )
         http_response_connection: HttpACGIResponseConnection = {
             'type': 'http.response.connection',
             'http_version': 'h11',
             'stream_id': None
         }
-        self._connection_event.set_with_message(http_response_connection)
+        self._control_messages.put_nowait(http_response_connection)
 
-        body = message['body']
-        more_body = message['more_body']
-        await self._send_request_data(body, more_body)
-        asyncio.create_task(self._receive_response())
+        self._response_task = asyncio.create_task(self._receive_response())
 
     async def _send_request_body(self, message: HttpACGIRequestBody) -> None:
         await self._send_request_data(
-            message.get('body', b''),
-            message.get('more_body', False)
+            message['body'],
+            message['more_body']
         )
 
     async def _send_request_data(
             self,
             body: Optional[bytes],
-            more_body: Optional[bool]
+            more_body: Optional[bool],
+            head: Optional[bytes] = None
     ) -> None:
-        if body is not None:
-            buf = self._h11_state.send(h11.Data(data=body))
-            assert buf is not None, "A non-empty body should always have data"
-            self.writer.write(buf)
+        buffers: List[bytes] = [] if head is None else [head]
+
+        if body:
+            # The body is passed through without being copied into the
+            # framing.
+            data = self._h11_state.send_with_data_passthrough(
+                h11.Data(data=body)
+            )
+            assert data is not None, "A non-empty body should always have data"
+            buffers.extend(data)
 
         if not more_body:
-            buf = self._h11_state.send(h11.EndOfMessage())
-            assert buf is not None, "End of message should always have data"
-            self.writer.write(buf)
+            data = self._h11_state.send_with_data_passthrough(_END_OF_MESSAGE)
+            assert data is not None, "End of message should always have data"
+            buffers.extend(data)
 
-        await self.writer.drain()
+        # The head, data and end of message are written together, and there
+        # is nothing to write for an empty chunk with more to follow.
+        if buffers:
+            self.writer.writelines(buffers)
+            await self._drain()
 
     async def _receive_response(self) -> None:
         while True:
@@ -147,12 +179,13 @@ class H11Protocol(HttpProtocol):
             else:
                 raise HttpProtocolError('Unknown event')
 
-        more_body = False
-        for name, value in event.headers:
-            if name == b'content-length' and int(value):
-                more_body = True
-            elif name == b'transfer-encoding' and value == b'chunked':
-                more_body = True
+        # h11 normalises header names to lower case.
+        headers = dict(event.headers)
+        content_length = headers.get(b'content-length')
+        more_body = (
+            (content_length is not None and int(content_length) != 0) or
+            headers.get(b'transfer-encoding') == b'chunked'
+        )
 
         http_response: HttpACGIResponse = {
             'type': 'http.response',
@@ -165,22 +198,31 @@ class H11Protocol(HttpProtocol):
             'more_body': more_body,
             'stream_id': None
         }
-        self._response_event.set_with_message(http_response)
+        self._control_messages.put_nowait(http_response)
 
     async def _disconnect(self) -> None:
+        if self._response_task is not None:
+            self._response_task.cancel()
+            await asyncio.gather(self._response_task, return_exceptions=True)
+            self._response_task = None
+
         if not self._is_message_ended and self._h11_state.our_state != h11.DONE:
 
             if self._h11_state.our_state == h11.MUST_CLOSE:
                 buf = self._h11_state.send(h11.ConnectionClosed())
             else:
-                buf = self._h11_state.send(h11.EndOfMessage())
+                buf = self._h11_state.send(_END_OF_MESSAGE)
 
             if buf:
                 self.writer.write(buf)
-                await self.writer.drain()
+                await self._drain()
 
         self.writer.close()
-        await self.writer.wait_closed()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            # The server may already have reset the connection.
+            pass
 
     async def _receive_body_event(self) -> HttpACGIResponses:
         while True:
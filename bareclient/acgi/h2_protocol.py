@@ -2,14 +2,15 @@
 
 import asyncio
 from asyncio import Task
+from collections import deque
 import functools
 from typing import (
-    Awaitable,
-    Callable,
+    Deque,
+    Dict,
     List,
-    MutableMapping,
     Optional,
     Sequence,
+    Set,
     Tuple,
     cast
 )
@@ -33,11 +34,40 @@ from .types import (
 from .http_protocol import HttpProtocol
 from .asyncio_events import ResetEvent
 
+# The common status codes, to avoid parsing them for every response.
+_STATUS_CODES = {
+    str(status_code).encode('ascii'): status_code
+    for status_code in (
+        100, 101, 200, 201, 202, 204, 206, 301, 302, 303, 304, 307, 308,
+        400, 401, 403, 404, 405, 409, 410, 412, 413, 416, 429,
+        500, 502, 503, 504
+    )
+}
+
+# Headers which are carried by pseudo headers or the framing in HTTP/2.
+_CONNECTION_SPECIFIC_HEADERS = frozenset((b'host', b'transfer-encoding'))
+
+
+@functools.lru_cache(maxsize=1024)
+def _pseudo_headers(
+        method: str,
+        host: str,
+        scheme: str
+) -> Tuple[Tuple[bytes, bytes], ...]:
+    # Repeated requests are commonly made to the same origin, so the encoded
+    # pseudo headers are reused. The path often differs for each request
+    # (ids, query strings), so it is not part of the key.
+    return (
+        (b":method", method.encode("ascii")),
+        (b":authority", host.encode("ascii")),
+        (b":scheme", scheme.encode("ascii"))
+    )
+
 
 class H2Protocol(HttpProtocol):
     """An HTTP/2 protocol handler"""
 
-    READ_NUM_BYTES = 4096
+    READ_NUM_BYTES = 65536
 
     def __init__(
             self,
@@ -52,13 +82,32 @@ class H2Protocol(HttpProtocol):
         """
         super().__init__(reader, writer)
         self.h2_state = h2.connection.H2Connection()
-        self.window_update_event: MutableMapping[int, ResetEvent] = {}
+        # A single event wakes any stream waiting on flow control, which
+        # then checks its own window.
+        self.window_update_event = ResetEvent()
+        # The error which ended the connection, if any.
+        self.connection_error: Optional[Exception] = None
         self.initialized = False
         self.responses: asyncio.Queue = asyncio.Queue()
-        self.response_task: Optional[asyncio.Task] = None
-        self.pending: List[Task] = []
-        self.on_close: Optional[Callable[[], Awaitable[None]]] = None
-        self.h2_events: List[h2.events.Event] = []
+        self.stream_closed_event: Dict[int, asyncio.Event] = {}
+        self.pending: Set[Task] = set()
+        self.close_stream_id: Optional[int] = None
+        self.h2_events: Deque[h2.events.Event] = deque()
+        # Serialises writing to the connection, which is shared by the
+        # sending task and the reading task.
+        self.write_lock = asyncio.Lock()
+
+    @property
+    def is_reusable(self) -> bool:
+        if not super().is_reusable:
+            return False
+        # The responses share a queue, so every stream must have finished,
+        # and its messages been received, before the next request is made.
+        return (
+            self.connection_error is None and
+            not self.stream_closed_event and
+            self.responses.empty()
+        )
 
     async def send(
             self,
@@ -71,12 +120,14 @@ class H2Protocol(HttpProtocol):
         elif message_type == 'http.request.body':
             await self._send_request_body(cast(HttpACGIRequestBody, message))
         elif message_type == 'http.disconnect':
-            if self.on_close:
-                await self.on_close()
+            if self.close_stream_id is not None:
+                await self._response_closed(self.close_stream_id)
         else:
             raise HttpProtocolError(f'unknown request type: {message_type}')
 
     async def receive(self) -> HttpACGIResponses:
+        if self.connection_error is not None and self.responses.empty():
+            raise self.connection_error
         return await self.responses.get()
 
     async def _send_request(
@@ -87,14 +138,16 @@ class H2Protocol(HttpProtocol):
         if not self.initialized:
             self._initiate_connection()
 
-        stream_id = await self._send_headers(
+        # The headers are flushed with the first data, or the end of the
+        # stream, so a small request is written at once.
+        stream_id = self._send_headers(
             message['scheme'],
             message['host'],
             message['path'],
             message['method'],
-            message.get('headers', [])
+            message['headers']
         )
-        self.window_update_event[stream_id] = ResetEvent()
+        self.stream_closed_event[stream_id] = asyncio.Event()
         http_response_connection: HttpACGIResponseConnection = {
             'type': 'http.response.connection',
             'http_version': 'h2',
@@ -110,10 +163,7 @@ class H2Protocol(HttpProtocol):
         else:
             await self._end_stream(stream_id)
 
-        self.response_task = asyncio.create_task(self._receive_response())
-        self.on_close = functools.partial(
-            self._response_closed, stream_id=stream_id
-        )
+        self.close_stream_id = stream_id
 
     async def _send_request_body(
             self,
@@ -123,17 +173,17 @@ class H2Protocol(HttpProtocol):
         await self._send_request_data(
             message['stream_id'],
             message['body'],
-            message.get('more_body', False)
+            message['more_body']
         )
 
     def _create_task(self, coroutine) -> Task:
         task = asyncio.create_task(coroutine)
-        self.pending.append(task)
+        self.pending.add(task)
         task.add_done_callback(self._reap_task)
         return task
 
     def _reap_task(self, task: Task):
-        self.pending.remove(task)
+        self.pending.discard(task)
 
     def _initiate_connection(self) -> None:
         self.h2_state.local_settings = h2.settings.Settings(
@@ -151,11 +201,13 @@ class H2Protocol(HttpProtocol):
 
         self.h2_state.initiate_connection()
         self.h2_state.increment_flow_control_window(2 ** 24)
-        data_to_send = self.h2_state.data_to_send()
-        self.writer.write(data_to_send)
         self.initialized = True
 
-    async def _send_headers(
+        # A single task reads from the connection for its lifetime, so flow
+        # control updates are received while a request is being sent.
+        self._create_task(self._receive_responses())
+
+    def _send_headers(
             self,
             scheme: str,
             host: str,
@@ -164,21 +216,18 @@ class H2Protocol(HttpProtocol):
             headers: Sequence[Tuple[bytes, bytes]]
     ) -> int:
         stream_id = self.h2_state.get_next_available_stream_id()
-        headers = [
-            (b":method", method.encode("ascii")),
-            (b":authority", host.encode("ascii")),
-            (b":scheme", scheme.encode("ascii")),
+        # Build the header block as a single list.
+        header_block = [
+            *_pseudo_headers(method, host, scheme),
             (b":path", path.encode("ascii")),
-        ] + [
-            (name, value)
-            for name, value in headers
-            if name not in (b'host', b'transfer-encoding')
+            *(
+                (name, value)
+                for name, value in headers
+                if name not in _CONNECTION_SPECIFIC_HEADERS
+            )
         ]
 
-        self.h2_state.send_headers(stream_id, headers)
-        data_to_send = self.h2_state.data_to_send()
-        self.writer.write(data_to_send)
-        await self.writer.drain()
+        self.h2_state.send_headers(stream_id, header_block)
 
         return stream_id
 
@@ -196,31 +245,80 @@ class H2Protocol(HttpProtocol):
             data: bytes,
             more_body: bool
     ) -> None:
-        while data:
-            window_size = self.h2_state.local_flow_control_window(stream_id)
-            chunk_size = min(
-                len(data),
-                window_size,
-                self.h2_state.max_outbound_frame_size
-            )
-            if chunk_size == 0:
-                await self.window_update_event[stream_id].wait()
-            else:
-                chunk, data = data[:chunk_size], data[chunk_size:]
-                self.h2_state.send_data(
+        # Frame the data through a view to avoid copying the remaining data
+        # for every frame.
+        view = memoryview(data)
+        offset, length = 0, len(view)
+        h2_state = self.h2_state
+        send_data = h2_state.send_data
+        local_flow_control_window = h2_state.local_flow_control_window
+        while offset < length:
+            if self.connection_error is not None:
+                raise ConnectionError(
+                    'connection lost while sending data'
+                ) from self.connection_error
+            # The flow control window and frame size can only change while
+            # awaiting, so they are read once for each window of frames.
+            window_size = local_flow_control_window(stream_id)
+            if window_size <= 0:
+                # Ensure any pending frames are sent before blocking.
+                await self._flush()
+                # The window may have been updated while flushing.
+                if local_flow_control_window(stream_id) <= 0:
+                    await self.window_update_event.wait()
+                continue
+
+            max_frame_size = h2_state.max_outbound_frame_size
+            window_end = min(length, offset + window_size)
+            while offset < window_end:
+                end = min(window_end, offset + max_frame_size)
+                send_data(
                     stream_id,
-                    chunk,
-                    end_stream=not more_body
+                    view[offset:end],
+                    end_stream=not more_body and end == length
                 )
-                data_to_send = self.h2_state.data_to_send()
-                self.writer.write(data_to_send)
-                await self.writer.drain()
+                offset = end
+
+            # Write the frames for the window at once.
+            await self._flush()
+
+        if length == 0:
+            if not more_body:
+                h2_state.end_stream(stream_id)
+            await self._flush()
 
     async def _end_stream(self, stream_id: int) -> None:
         self.h2_state.end_stream(stream_id)
-        data_to_send = self.h2_state.data_to_send()
-        self.writer.write(data_to_send)
-        await self.writer.drain()
+        await self._flush()
+
+    async def _flush(self) -> None:
+        # The lock is taken before collecting the data so frames are written
+        # in the order h2 produced them.
+        async with self.write_lock:
+            data_to_send = self.h2_state.data_to_send()
+            if data_to_send:
+                self.writer.write(data_to_send)
+                await self._drain()
+
+    async def _receive_responses(self) -> None:
+        try:
+            while True:
+                await self._receive_response()
+        except Exception as error:  # pylint: disable=broad-except
+            # The task reads the connection for its lifetime, so any error
+            # ends the connection. It is kept to be raised to the caller.
+            # Wake any stream waiting on flow control, which will find the
+            # connection has gone.
+            self.connection_error = error
+            self.window_update_event.set()
+            # Disconnect any streams still waiting for their responses.
+            for stream_id, closed_event in self.stream_closed_event.items():
+                http_disconnect: HttpACGIDisconnect = {
+                    'type': 'http.disconnect',
+                    'stream_id': stream_id
+                }
+                await self.responses.put(http_disconnect)
+                closed_event.set()
 
     async def _receive_response(self) -> None:
 
@@ -228,13 +326,19 @@ class H2Protocol(HttpProtocol):
         while not isinstance(event, h2.events.ResponseReceived):
             event = await self._receive_event()
 
-        status_code = 200
-        headers: List[Tuple[bytes, bytes]] = []
-        for name, value in event.headers or []:
-            if name == b":status":
-                status_code = int(value)
-            elif not name.startswith(b":"):
-                headers.append((name, value))
+        response_headers = event.headers or []
+        headers: List[Tuple[bytes, bytes]] = [
+            (name, value)
+            for name, value in response_headers
+            if name[:1] != b':'
+        ]
+        # The pseudo headers come first, so the scan for the status stops at
+        # the start of the block.
+        status = next(
+            (value for name, value in response_headers if name == b':status'),
+            b'200'
+        )
+        status_code = _STATUS_CODES.get(status) or int(status)
 
         http_response: HttpACGIResponse = {
             'type': 'http.response',
@@ -250,66 +354,115 @@ class H2Protocol(HttpProtocol):
         }
         await self.responses.put(http_response)
 
-        is_connected = True
-        while is_connected:
+        stream_id = event.stream_id
+        more_body = event.stream_ended is None
+        while True:
             event = await self._receive_event()
             if isinstance(event, h2.events.DataReceived):
+                assert event.data is not None, "data received cannot be None"
+                # Coalesce the data already received for the stream into a
+                # single body message, acknowledging it once.
+                parts = [event.data]
+                flow_controlled_length = event.flow_controlled_length
+                while (
+                        event.stream_ended is None and
+                        self.h2_events and
+                        isinstance(self.h2_events[0], h2.events.DataReceived) and
+                        self.h2_events[0].stream_id == event.stream_id
+                ):
+                    event = cast(
+                        h2.events.DataReceived,
+                        self.h2_events.popleft()
+                    )
+                    parts.append(event.data)
+                    flow_controlled_length += event.flow_controlled_length
                 self.h2_state.acknowledge_received_data(
-                    event.flow_controlled_length, event.stream_id
+                    flow_controlled_length, event.stream_id
                 )
-                assert event.data is not None, "data received cannot be None"
+                more_body = event.stream_ended is None
                 http_response_body: HttpACGIResponseBody = {
                     'type': 'http.response.body',
-                    'body': event.data,
-                    'more_body': event.stream_ended is None,
+                    'body': parts[0] if len(parts) == 1 else b''.join(parts),
+                    'more_body': more_body,
                     'stream_id': event.stream_id
                 }
                 await self.responses.put(http_response_body)
-            elif isinstance(event, (h2.events.StreamEnded, h2.events.StreamReset)):
+            elif isinstance(event, h2.events.StreamEnded):
+                # The stream may be ended by trailers rather than data.
+                if more_body:
+                    http_response_body = {
+                        'type': 'http.response.body',
+                        'body': b'',
+                        'more_body': False,
+                        'stream_id': event.stream_id
+                    }
+                    await self.responses.put(http_response_body)
+                break
+            elif isinstance(event, h2.events.StreamReset):
                 http_disconnect: HttpACGIDisconnect = {
                     'type': 'http.disconnect',
                     'stream_id': event.stream_id
                 }
                 await self.responses.put(http_disconnect)
-                is_connected = False
+                break
+
+        closed_event = self.stream_closed_event.pop(stream_id, None)
+        if closed_event is not None:
+            closed_event.set()
 
     async def _receive_event(self) -> h2.events.Event:
+        h2_state = self.h2_state
+        append_event = self.h2_events.append
         while not self.h2_events:
             data = await self.reader.read(self.READ_NUM_BYTES)
-            events = self.h2_state.receive_data(data)
+            if not data:
+                raise ConnectionError('connection closed')
+            events = h2_state.receive_data(data)
             for event in events:
-                if isinstance(event, h2.events.WindowUpdated):
-                    assert event.stream_id is not None, "window updated always has stream_id"
-                    if event.stream_id == 0:
-                        for update_event in self.window_update_event.values():
-                            update_event.set()
-                    else:
-                        self.window_update_event[event.stream_id].set()
-
-                self.h2_events.append(event)
-
-            data_to_send = self.h2_state.data_to_send()
-            self.writer.write(data_to_send)
-            await self.writer.drain()
-
-        return self.h2_events.pop(0)
+                # A change of settings may also open the windows.
+                if isinstance(
+                        event,
+                        (h2.events.WindowUpdated, h2.events.RemoteSettingsChanged)
+                ):
+                    self.window_update_event.set()
+
+                append_event(event)
+
+            # Most reads (such as data frames) produce nothing to send.
+            await self._flush()
+
+        event = self.h2_events.popleft()
+        if isinstance(event, h2.events.ConnectionTerminated):
+            # The events before the GOAWAY have been handled, so the streams
+            # still open can be disconnected.
+            raise ConnectionError(
+                f'connection terminated: {event.error_code!r}'
+            )
+        return event
 
     async def _response_closed(self, stream_id: int) -> None:
-        del self.window_update_event[stream_id]
-
-        # Drain responses to allow the socket to close cleanly.
-        if self.response_task is not None:
-            await self.response_task
-            while self.responses.qsize():
-                await self.responses.get()
-
-        for task in self.pending:
-            if not task.done():
-                try:
-                    task.cancel()
-                    await task
-                except asyncio.CancelledError:
-                    pass
+        # Wait for the response to complete to allow the socket to close
+        # cleanly.
+        closed_event = self.stream_closed_event.get(stream_id)
+        if closed_event is not None:
+            await closed_event.wait()
+        while self.responses.qsize():
+            self.responses.get_nowait()
+
+        # Cancel the outstanding tasks together, and wait for them all at
+        # once. Reaping them mutates the set, so a list is taken first.
+        pending = [task for task in self.pending if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
 
         self.writer.close()
         await self.writer.wait_closed()
+
+        # A closed or terminated connection is reported to the streams as a
+        # disconnect, but any other failure of the reader is raised.
+        if (
+                self.connection_error is not None and
+                not isinstance(self.connection_error, ConnectionError)
+        ):
+            raise self.connection_error
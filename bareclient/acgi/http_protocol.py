@@ -23,6 +23,35 @@ class HttpProtocol(metaclass=ABCMeta):
         self.reader = reader
         self.writer = writer
 
+    @property
+    def is_reusable(self) -> bool:
+        """Check if the connection can be used for another request.
+
+        Returns:
+            bool: True if a further request may be sent on the connection.
+        """
+        # The server may have closed an idle connection, which is only seen
+        # on the reader.
+        return not (
+            self.writer.is_closing() or
+            self.reader.at_eof() or
+            self.reader.exception() is not None
+        )
+
+    async def _drain(self) -> None:
+        # Draining only waits when the transport buffer is past its
+        # high-water mark, so the round trip through the event loop is
+        # skipped otherwise. A lost connection is only reported by drain, so
+        # it always runs once the connection is closing or has failed.
+        transport = self.writer.transport
+        _low, high = transport.get_write_buffer_limits()
+        if (
+                transport.is_closing() or
+                self.reader.exception() is not None or
+                transport.get_write_buffer_size() > high
+        ):
+            await self.writer.drain()
+
     @abstractmethod
     async def send(self, message: HttpACGIRequests) -> None:
         """Send a message to the web server
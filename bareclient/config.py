@@ -29,12 +29,22 @@ class HttpClientConfig:
         self.capath = capath
         self.cadata = cadata
         self._ssl_context = ssl_context
-        self.alpn_protocols = alpn_protocols
-        self.ciphers = ciphers
-        self.options = options
+        # Held as tuples so they can key the connector's ssl context cache.
+        self.alpn_protocols = tuple(alpn_protocols)
+        self.ciphers = tuple(ciphers)
+        self.options = tuple(options)
         self.connect_timeout = connect_timeout
         self.proxy = proxy
 
+    @property
+    def has_ssl_context(self) -> bool:
+        """Check if an ssl context was passed or has been created.
+
+        Returns:
+            bool: True if the config holds an ssl context.
+        """
+        return self._ssl_context is not None
+
     @property
     def ssl_context(self) -> SSLContext:
         if self._ssl_context is None:
@@ -1,12 +1,16 @@
 """Connections"""
 
 import asyncio
+from functools import lru_cache
 import logging
+from ssl import Options, SSLContext
 from typing import (
     Any,
     Awaitable,
     Callable,
-    Coroutine
+    Coroutine,
+    Optional,
+    Tuple
 )
 from urllib.error import URLError
 
@@ -19,7 +23,9 @@ from .acgi import (
 )
 from .config import HttpClientConfig
 from .connection import ConnectionDetails
+from .constants import AlpnProtocol
 from .response import Response
+from .ssl_contexts import create_ssl_context
 from .utils import get_negotiated_protocol
 
 SendCallable = Callable[[HttpACGIRequests], Coroutine[Any, Any, None]]
@@ -33,6 +39,59 @@ Application = Callable[
 LOGGER = logging.getLogger(__name__)
 
 
+# The arguments from which a shared ssl context is created.
+_SslContextKey = Tuple[
+    Optional[str],
+    Optional[str],
+    Optional[str],
+    Tuple[AlpnProtocol, ...],
+    Tuple[str, ...],
+    Tuple[Options, ...]
+]
+
+
+@lru_cache(maxsize=8)
+def _get_shared_ssl_context(key: _SslContextKey) -> SSLContext:
+    # Connections with the same trust anchors share a single context, and its
+    # TLS session cache, rather than building a new one for each request.
+    # The context is never handed to callers, so it cannot be changed by one
+    # config and leak into another.
+    cafile, capath, cadata, alpn_protocols, ciphers, options = key
+    return create_ssl_context(
+        cafile,
+        capath,
+        cadata,
+        alpn_protocols=alpn_protocols,
+        ciphers=ciphers,
+        options=options
+    )
+
+
+def get_ssl_context(config: HttpClientConfig) -> SSLContext:
+    """Get the ssl context with which to connect.
+
+    The context of the config is used if one was passed, or has been
+    created through the config. Otherwise a context shared by configs with
+    the same arguments is used.
+
+    Args:
+        config (HttpClientConfig): The HTTP client configuration.
+
+    Returns:
+        SSLContext: The ssl context.
+    """
+    if config.has_ssl_context:
+        return config.ssl_context
+    return _get_shared_ssl_context((
+        config.cafile,
+        config.capath,
+        config.cadata,
+        config.alpn_protocols,
+        config.ciphers,
+        config.options
+    ))
+
+
 async def connect(connection: ConnectionDetails, config: HttpClientConfig) -> HttpProtocol:
     """Connect to the web server and run the application
 
@@ -48,7 +107,7 @@ async def connect(connection: ConnectionDetails, config: HttpClientConfig) -> Ht
         HttpProtocol: The http protocol.
     """
     ssl_context = (
-        config.ssl_context if connection.scheme == 'https'
+        get_ssl_context(config) if connection.scheme == 'https'
         else None
     )
 
@@ -77,10 +136,14 @@ async def connect(connection: ConnectionDetails, config: HttpClientConfig) -> Ht
         port,
         ssl=ssl_context
     )
-    reader, writer = await asyncio.wait_for(
-        future,
-        timeout=config.connect_timeout
-    )
+    # Only wrap the connection in a timeout when one is configured.
+    if config.connect_timeout is None:
+        reader, writer = await future
+    else:
+        reader, writer = await asyncio.wait_for(
+            future,
+            timeout=config.connect_timeout
+        )
 
     negotiated_protocol = get_negotiated_protocol(
         writer
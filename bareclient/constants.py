@@ -14,6 +14,7 @@ SYSNAME, HOST, RELEASE, OS_VERSION, MACHINE, PROCESSOR = platform.uname()
 USER_AGENT = f'bareClient/{DIST_VERSION} ({SYSNAME}; {RELEASE}; {MACHINE})'.encode(
     'ascii'
 )
+USER_AGENT_HEADER = (b'user-agent', USER_AGENT)
 
 AlpnProtocol = Literal["h2", "http/1.1"]
 
@@ -1,7 +1,17 @@
 """Helpers"""
 
+import asyncio
 import json
-from typing import Any, Callable, List, Optional, Sequence, Tuple
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union
+)
 
 from bareutils import bytes_writer, text_writer, header
 
@@ -9,6 +19,12 @@ from .client import HttpClient
 from .config import HttpClientConfig
 from .middleware import HttpClientMiddlewareCallback
 
+# The default headers are shared rather than built for every request.
+_ACCEPT_TEXT_HEADER = (header.ACCEPT, b'text/plain')
+_ACCEPT_JSON_HEADER = (header.ACCEPT, b'application/json')
+_CONTENT_TYPE_TEXT_HEADER = (header.CONTENT_TYPE, b'text/plain')
+_CONTENT_TYPE_JSON_HEADER = (header.CONTENT_TYPE, b'application/json')
+
 
 async def get(
         url: str,
@@ -90,7 +106,7 @@ async def get_text(
     headers = [] if headers is None else list(headers)
 
     if not header.find(header.ACCEPT, headers):
-        headers.append((header.ACCEPT, b'text/plain'))
+        headers.append(_ACCEPT_TEXT_HEADER)
 
     async with HttpClient(
             url,
@@ -147,7 +163,7 @@ async def get_json(
     headers = [] if headers is None else list(headers)
 
     if not header.find(header.ACCEPT, headers):
-        headers.append((header.ACCEPT, b'application/json'))
+        headers.append(_ACCEPT_JSON_HEADER)
 
     async with HttpClient(
             url,
@@ -160,6 +176,70 @@ async def get_json(
         return await response.json(loads)
 
 
+async def gather_json(
+        urls: Sequence[str],
+        *,
+        max_concurrency: int = 16,
+        **kwargs: Any
+) -> List[Optional[Any]]:
+    """Issues concurrent GET requests returning JSON objects
+
+    The following gets several json objects, with at most two requests in
+    flight at a time:
+
+    ```python
+    import asyncio
+    from typing import List
+    from bareclient import gather_json
+
+    async def main(urls: List[str]) -> None:
+        objs = await gather_json(urls, max_concurrency=2)
+        print(objs)
+
+    asyncio.run(main([
+        'https://jsonplaceholder.typicode.com/todos/1',
+        'https://jsonplaceholder.typicode.com/todos/2',
+        'https://jsonplaceholder.typicode.com/todos/3'
+    ]))
+    ```
+
+    If any request fails the requests still in flight are cancelled, and the
+    error is raised.
+
+    Args:
+        urls (Sequence[str]): The urls
+        max_concurrency (int, optional): The maximum number of requests in
+            flight at once. Defaults to 16.
+        **kwargs (Any): The keyword arguments for `get_json` (headers,
+            middleware, loads and config) applied to every request.
+
+    Raises:
+        ValueError: If max_concurrency is not positive.
+        HttpClientError: Is the status code of any response is not ok.
+        asyncio.TimeoutError: If a connect times out.
+
+    Returns:
+        List[Optional[Any]]: The decoded JSON objects in the order of the urls.
+    """
+    if max_concurrency <= 0:
+        raise ValueError('max_concurrency must be positive')
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(url: str) -> Optional[Any]:
+        async with semaphore:
+            return await get_json(url, **kwargs)
+
+    tasks = [asyncio.create_task(fetch(url)) for url in urls]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        # A failure leaves the other requests running, so they are cancelled.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
 async def post(
         url: str,
         content: bytes,
@@ -239,12 +319,14 @@ async def post_text(
 
     headers = [] if headers is None else list(headers)
 
-    if not header.find(header.ACCEPT, headers):
-        headers.append((header.ACCEPT, b'text/plain'))
+    # Collect the names once to check for both default headers.
+    names = {name for name, _value in headers}
+    if header.ACCEPT not in names:
+        headers.append(_ACCEPT_TEXT_HEADER)
 
     content = text.encode(encoding=encoding)
-    if not header.find(header.CONTENT_TYPE, headers):
-        headers.append((header.CONTENT_TYPE, b'text/plain'))
+    if header.CONTENT_TYPE not in names:
+        headers.append(_CONTENT_TYPE_TEXT_HEADER)
 
     data = bytes_writer(content, chunk_size) if content else None
 
@@ -265,7 +347,7 @@ async def post_json(
         obj: Any,
         *,
         loads: Callable[[bytes], Any] = json.loads,
-        dumps: Callable[[Any], str] = json.dumps,
+        dumps: Callable[[Any], Union[str, bytes]] = json.dumps,
         headers: Optional[Sequence[Tuple[bytes, bytes]]] = None,
         middleware: Optional[List[HttpClientMiddlewareCallback]] = None,
         chunk_size: int = -1,
@@ -293,8 +375,10 @@ async def post_json(
         obj (Any): The JSON payload
         loads (Callable[[bytes], Any], optional): The function used to decode
             the response. Defaults to json.loads.
-        dumps (Callable[[Any], str], optional): The function used to encode
-            the request. Defaults to json.dumps.
+        dumps (Callable[[Any], Union[str, bytes]], optional): The function
+            used to encode the request. A function returning bytes (e.g.
+            `orjson.dumps`) is sent without re-encoding. Defaults to
+            json.dumps.
         headers (Optional[Sequence[Tuple[bytes, bytes]]], optional): Any extra
             headers required. Defaults to None.
         middleware (Optional[List[HttpClientMiddlewareCallback]], optional):
@@ -314,14 +398,22 @@ async def post_json(
 
     headers = [] if headers is None else list(headers)
 
-    if not header.find(header.ACCEPT, headers):
-        headers.append((header.ACCEPT, b'application/json'))
+    # Collect the names once to check for both default headers.
+    names = {name for name, _value in headers}
+    if header.ACCEPT not in names:
+        headers.append(_ACCEPT_JSON_HEADER)
 
     content = dumps(obj)
-    if not header.find(header.CONTENT_TYPE, headers):
-        headers.append((header.CONTENT_TYPE, b'application/json'))
-
-    data = text_writer(content, chunk_size=chunk_size) if content else None
+    if header.CONTENT_TYPE not in names:
+        headers.append(_CONTENT_TYPE_JSON_HEADER)
+
+    data: Optional[AsyncIterable[bytes]]
+    if not content:
+        data = None
+    elif isinstance(content, bytes):
+        data = bytes_writer(content, chunk_size)
+    else:
+        data = text_writer(content, chunk_size=chunk_size)
 
     async with HttpClient(
             url,
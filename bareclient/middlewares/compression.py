@@ -5,7 +5,8 @@ from typing import (
     Mapping,
     Optional,
     Sequence,
-    Tuple
+    Tuple,
+    TypeVar
 )
 
 from bareutils import (
@@ -24,6 +25,8 @@ from ..request import Request
 from ..response import Response
 from ..middleware import HttpClientCallback
 
+T = TypeVar('T')
+
 Decompressors = Mapping[bytes, DecompressorFactory]
 
 DEFAULT_DECOMPRESSORS: Decompressors = {
@@ -39,16 +42,30 @@ DEFAULT_COMPRESSORS: Compressors = {
 }
 
 
+def _find_factory(
+    headers: Sequence[Tuple[bytes, bytes]],
+    factories: Mapping[bytes, T]
+) -> Optional[T]:
+    content_encoding = header.find(header.CONTENT_ENCODING, headers)
+    if not content_encoding:
+        return None
+    # Usually there is a single encoding, which can be looked up directly.
+    factory = factories.get(content_encoding)
+    if factory is None and b',' in content_encoding:
+        for encoding in content_encoding.split(b', '):
+            if encoding in factories:
+                return factories[encoding]
+    return factory
+
+
 def _make_body_writer(
     headers: Sequence[Tuple[bytes, bytes]],
     body: Optional[AsyncIterable[bytes]]
 ) -> Optional[AsyncIterable[bytes]]:
-    content_encoding = header.content_encoding(headers)
-    if content_encoding and body is not None:
-        for encoding in content_encoding:
-            if encoding in DEFAULT_COMPRESSORS:
-                compressor = DEFAULT_COMPRESSORS[encoding]
-                return compression_writer_adapter(body, compressor())
+    if body is not None:
+        compressor = _find_factory(headers, DEFAULT_COMPRESSORS)
+        if compressor is not None:
+            return compression_writer_adapter(body, compressor())
     return body
 
 
@@ -56,12 +73,10 @@ def _make_body_reader(
     headers: Sequence[Tuple[bytes, bytes]],
     body: Optional[AsyncIterable[bytes]]
 ) -> Optional[AsyncIterable[bytes]]:
-    content_encoding = header.content_encoding(headers)
-    if content_encoding and body is not None:
-        for encoding in content_encoding:
-            if encoding in DEFAULT_DECOMPRESSORS:
-                decompressor = DEFAULT_DECOMPRESSORS[encoding]
-                return compression_reader_adapter(body, decompressor())
+    if body is not None:
+        decompressor = _find_factory(headers, DEFAULT_DECOMPRESSORS)
+        if decompressor is not None:
+            return compression_reader_adapter(body, decompressor())
     return body
 
 
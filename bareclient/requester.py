@@ -1,5 +1,6 @@
 """Requester"""
 
+from functools import lru_cache
 import logging
 from typing import (
     AsyncIterable,
@@ -26,7 +27,8 @@ from .acgi import (
 )
 from .config import HttpClientConfig
 from .connection import ConnectionDetails
-from .constants import USER_AGENT
+from .connector import get_ssl_context
+from .constants import USER_AGENT_HEADER
 from .middleware import HttpClientMiddlewareCallback, make_middleware_chain
 from .request import Request
 from .response import Response
@@ -35,13 +37,21 @@ from .utils import get_negotiated_protocol
 
 LOGGER = logging.getLogger(__name__)
 
+_TRANSFER_ENCODING_CHUNKED_HEADER = (b'transfer-encoding', b'chunked')
+
+
+@lru_cache(maxsize=128)
+def _host_header(host: str) -> Tuple[bytes, bytes]:
+    # Requests are typically made repeatedly to the same few hosts.
+    return b'host', host.encode('ascii')
+
 
 def _enrich_headers(request: Request) -> List[Tuple[bytes, bytes]]:
     headers = [] if not request.headers else list(request.headers)
     if not header.find(b'user-agent', headers):
-        headers.append((b'user-agent', USER_AGENT))
+        headers.append(USER_AGENT_HEADER)
     if not header.find(b'host', headers):
-        headers.append((b'host', request.host.encode('ascii')))
+        headers.append(_host_header(request.host))
     if (
             request.body and not
             (
@@ -49,34 +59,21 @@ def _enrich_headers(request: Request) -> List[Tuple[bytes, bytes]]:
                 or header.find(b'transfer-encoding', headers)
             )
     ):
-        headers.append((b'transfer-encoding', b'chunked'))
+        headers.append(_TRANSFER_ENCODING_CHUNKED_HEADER)
     return headers
 
 
 async def _make_body_writer(
-        content: Optional[AsyncIterable[bytes]]
+        content: AsyncIterable[bytes]
 ) -> AsyncIterator[Tuple[Optional[bytes], bool]]:
-    if content is None:
-        yield None, False
-    else:
-        more_body = True
-        content_iter = aiter(content)
-        try:
-            first: Optional[bytes] = await anext(content_iter)
-        except StopAsyncIteration:
-            first = None
-            more_body = False
-            yield first, more_body
-
-        while more_body:
-            try:
-                second: Optional[bytes] = await anext(content_iter)
-            except StopAsyncIteration:
-                second = None
-                more_body = False
-
-            yield first, more_body
-            first = second
+    # Read one part ahead to know when the last part is being sent.
+    previous: Optional[bytes] = None
+    has_previous = False
+    async for body in content:
+        if has_previous:
+            yield previous, True
+        has_previous, previous = True, body
+    yield previous, False
 
 
 class RequesterInstance:
@@ -117,10 +114,42 @@ class RequesterInstance:
             self,
             request: Request
     ) -> None:
+        headers = _enrich_headers(request)
+
+        if request.body is None:
+            # A request without content is sent as a single message.
+            await self._send_request(request, headers, None, False)
+            return
+
         body_writer = aiter(_make_body_writer(request.body))
         body, more_body = await anext(body_writer)
-        headers = _enrich_headers(request)
+        stream_id = await self._send_request(
+            request,
+            headers,
+            body,
+            more_body
+        )
+
+        # The protocols consume the message before send returns, so one
+        # message is reused for every part of the body.
+        http_request_body: HttpACGIRequestBody = {
+            'type': 'http.request.body',
+            'body': b'',
+            'more_body': True,
+            'stream_id': stream_id
+        }
+        async for body, more_body in body_writer:
+            http_request_body['body'] = body or b''
+            http_request_body['more_body'] = more_body
+            await self._http_protocol.send(http_request_body)
 
+    async def _send_request(
+            self,
+            request: Request,
+            headers: List[Tuple[bytes, bytes]],
+            body: Optional[bytes],
+            more_body: bool
+    ) -> Optional[int]:
         http_request: HttpACGIRequest = {
             'type': 'http.request',
             'host': request.host,
@@ -137,17 +166,7 @@ class RequesterInstance:
             HttpACGIResponseConnection,
             await self._http_protocol.receive()
         )
-
-        stream_id: Optional[int] = connection['stream_id']
-
-        async for body, more_body in body_writer:
-            http_request_body: HttpACGIRequestBody = {
-                'type': 'http.request.body',
-                'body': body or b'',
-                'more_body': more_body,
-                'stream_id': stream_id
-            }
-            await self._http_protocol.send(http_request_body)
+        return connection['stream_id']
 
     async def _process_response(self, url: str) -> Response:
         response = await self._http_protocol.receive()
@@ -159,7 +178,7 @@ class RequesterInstance:
             http_response = cast(HttpACGIResponse, response)
             body_reader = (
                 self._body_reader()
-                if http_response.get('more_body', False)
+                if http_response['more_body']
                 else None
             )
             return Response(
@@ -172,9 +191,10 @@ class RequesterInstance:
         raise ValueError(f'Invalid type "{response["type"]}"')
 
     async def _body_reader(self) -> AsyncIterator[bytes]:
+        receive = self._http_protocol.receive
         more_body = True
         while more_body:
-            response = await self._http_protocol.receive()
+            response = await receive()
             if response['type'] == 'http.disconnect':
                 raise IOError('server disconnected')
             elif response['type'] == 'http.response.body':
@@ -249,7 +269,7 @@ class Requester:
             status_event['http_version']
         )
 
-        ssl_context = config.ssl_context
+        ssl_context = get_ssl_context(config)
         await http_protocol.writer.start_tls(ssl_context)
 
         negotiated_protocol = get_negotiated_protocol(
@@ -12,11 +12,15 @@ from typing import (
     Tuple,
 )
 
-from bareutils import text_reader, bytes_reader
-
 from .errors import HttpClientError
 
 
+async def _read_body(body: AsyncIterable[bytes]) -> bytes:
+    # Joining the parts once avoids copying the body read so far for every
+    # part received.
+    return b''.join([part async for part in body])
+
+
 class Response:
     """An HTTP response"""
 
@@ -53,7 +57,8 @@ class Response:
         """
         if self.body is None:
             return None
-        return await text_reader(self.body, encoding=encoding)
+        buf = await _read_body(self.body)
+        return buf.decode(encoding)
 
     async def raw(self) -> Optional[bytes]:
         """Read the body as bytes.
@@ -63,7 +68,7 @@ class Response:
         """
         if self.body is None:
             return None
-        return await bytes_reader(self.body)
+        return await _read_body(self.body)
 
     async def json(
             self,
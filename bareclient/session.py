@@ -42,6 +42,16 @@ class SessionInstance:
             headers: Optional[Sequence[Tuple[bytes, bytes]]] = None,
             body: Optional[AsyncIterable[bytes]] = None
     ):
+        if (
+                self._http_protocol is not None and
+                not self._http_protocol.is_reusable
+        ):
+            try:
+                await self.close()
+            except ConnectionError:
+                # The connection is being discarded because it has been lost.
+                pass
+
         if self._http_protocol is None:
             self._http_protocol = await connect(
                 self._connection_details,
@@ -61,9 +71,11 @@ class SessionInstance:
             body
         )
 
-        requester = Requester()
+        # The connection is kept open between requests, and closed through
+        # the most recent requester when the session ends.
+        self._handler = Requester()
 
-        response = await requester(
+        response = await self._handler(
             request,
             self._middleware,
             self._http_protocol,
@@ -76,7 +88,11 @@ class SessionInstance:
         """Close the session"""
         if self._handler is None:
             return
-        await self._handler.close()
+        try:
+            await self._handler.close()
+        finally:
+            self._handler = None
+            self._http_protocol = None
 
 
 class HttpSession:
@@ -7,7 +7,7 @@ from typing import (
     AnyStr,
     Callable,
     Iterable,
-    Optional,
+    Optional
 )
 
 from .constants import DEFAULT_ALPN_PROTOCOLS, AlpnProtocol
@@ -1,29 +1,10 @@
 """Tests for async_events.py"""
 
 import asyncio
-from typing import Optional
 
 import pytest
 
-from bareclient.acgi.asyncio_events import MessageEvent, ResetEvent
-
-
-@pytest.mark.asyncio
-async def test_message_event() -> None:
-    """Test for message event"""
-
-    async def waiter(event: MessageEvent[str]) -> Optional[str]:
-        return await event.wait_with_message()
-
-    event: MessageEvent[str] = MessageEvent()
-    waiter_task = asyncio.create_task(waiter(event))
-
-    await asyncio.sleep(0.1)
-    message = "hello"
-    event.set_with_message(message)
-
-    await waiter_task
-    assert waiter_task.result() == message
+from bareclient.acgi.asyncio_events import ResetEvent
 
 
 @pytest.mark.asyncio
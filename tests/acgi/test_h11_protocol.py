@@ -0,0 +1,45 @@
+"""Tests for h11_protocol.py"""
+
+import asyncio
+
+import h11
+import pytest
+
+from bareclient.acgi.h11_protocol import H11Protocol
+
+
+@pytest.mark.asyncio
+async def test_h11_invalid_response():
+    """Test an invalid response is raised from receive"""
+
+    async def serve(
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter
+    ) -> None:
+        await reader.read(65536)
+        writer.write(b'not a response\r\n\r\n')
+        await writer.drain()
+
+    server = await asyncio.start_server(serve, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    protocol = H11Protocol(reader, writer, 65536)
+    await protocol.send({
+        'type': 'http.request',
+        'method': 'GET',
+        'path': '/',
+        'headers': [(b'host', b'127.0.0.1')],
+        'body': b'',
+        'more_body': False
+    })
+
+    message = await protocol.receive()
+    assert message['type'] == 'http.response.connection'
+    with pytest.raises(h11.RemoteProtocolError):
+        await asyncio.wait_for(protocol.receive(), 5)
+
+    await protocol.send({'type': 'http.disconnect', 'stream_id': None})
+
+    server.close()
+    await server.wait_closed()
@@ -0,0 +1,349 @@
+"""Tests for h2_protocol.py"""
+
+import asyncio
+from typing import Tuple
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.exceptions
+import pytest
+
+from bareclient.acgi.h2_protocol import H2Protocol
+from bareclient.config import HttpClientConfig
+from bareclient.request import Request
+from bareclient.requester import Requester
+
+
+async def _serve_echo(
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+) -> None:
+    conn = h2.connection.H2Connection(
+        config=h2.config.H2Configuration(client_side=False)
+    )
+    conn.initiate_connection()
+    writer.write(conn.data_to_send())
+    bodies = {}
+    paths = {}
+    while True:
+        data = await reader.read(65536)
+        if not data:
+            break
+        for event in conn.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                bodies[event.stream_id] = b''
+                paths[event.stream_id] = dict(event.headers)[b':path']
+            elif isinstance(event, h2.events.DataReceived):
+                conn.acknowledge_received_data(
+                    event.flow_controlled_length,
+                    event.stream_id
+                )
+                bodies[event.stream_id] += event.data
+            if (
+                    isinstance(event, h2.events.StreamEnded)
+                    or (
+                        isinstance(
+                            event,
+                            (h2.events.RequestReceived, h2.events.DataReceived)
+                        )
+                        and event.stream_ended is not None
+                    )
+            ):
+                stream_id = event.stream_id
+                body = bodies.pop(stream_id, None)
+                if body is None:
+                    continue
+                conn.send_headers(
+                    stream_id,
+                    [
+                        (b':status', b'201'),
+                        (b'x-stream-id', str(stream_id).encode())
+                    ]
+                )
+                if paths.pop(stream_id) == b'/length':
+                    body = str(len(body)).encode()
+                body = body or b'empty'
+                # Use small frames so a read yields several data events.
+                frame_size = 1000
+                while body:
+                    chunk, body = body[:frame_size], body[frame_size:]
+                    conn.send_data(stream_id, chunk, end_stream=not body)
+        writer.write(conn.data_to_send())
+        await writer.drain()
+    writer.close()
+
+
+async def _post(port: int, path: str, body: bytes) -> bytes:
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    http_protocol = H2Protocol(reader, writer)
+    requester, content = await _request(http_protocol, port, path, body)
+    await requester.close()
+    return content
+
+
+async def _request(
+        http_protocol: H2Protocol,
+        port: int,
+        path: str,
+        body: bytes
+) -> Tuple[Requester, bytes]:
+    async def producer():
+        yield body
+
+    request = Request(
+        f'127.0.0.1:{port}',
+        'http',
+        path,
+        'POST',
+        [(b'content-length', str(len(body)).encode())],
+        producer()
+    )
+    requester = Requester()
+    response = await requester(
+        request,
+        [],
+        http_protocol,
+        HttpClientConfig()
+    )
+    assert response.status == 201
+    content = await response.raw()
+    assert content is not None
+    return requester, content
+
+
+@pytest.mark.asyncio
+async def test_h2_request():
+    """Test a request and response over HTTP/2"""
+    server = await asyncio.start_server(_serve_echo, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+
+    assert await _post(port, '/echo', b'hello') == b'hello'
+
+    # A body spanning several frames.
+    body = bytes(range(256)) * 160
+    assert await _post(port, '/echo', body) == body
+
+    # A body larger than the initial flow control window.
+    body = bytes(range(256)) * 1024
+    assert await _post(port, '/length', body) == b'262144'
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_h2_requests_on_one_connection():
+    """Test sequential requests over one HTTP/2 connection"""
+    server = await asyncio.start_server(_serve_echo, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    http_protocol = H2Protocol(reader, writer)
+    for body in (b'one', b'two', b'three'):
+        requester, content = await _request(
+            http_protocol,
+            port,
+            '/echo',
+            body
+        )
+        assert content == body
+    await requester.close()
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_h2_is_reusable():
+    """Test an HTTP/2 connection is not reused until the response is read"""
+    server = await asyncio.start_server(_serve_echo, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    http_protocol = H2Protocol(reader, writer)
+    assert http_protocol.is_reusable
+
+    await _request(http_protocol, port, '/echo', b'one')
+    assert http_protocol.is_reusable
+
+    async def producer():
+        yield b'two' * 1000
+
+    requester = Requester()
+    response = await requester(
+        Request(f'127.0.0.1:{port}', 'http', '/echo', 'POST', [], producer()),
+        [],
+        http_protocol,
+        HttpClientConfig()
+    )
+    assert response.status == 201
+    # Give the server time to send the body, which is not read.
+    await asyncio.sleep(0.1)
+    assert not http_protocol.is_reusable
+    await requester.close()
+
+    server.close()
+    await server.wait_closed()
+
+
+async def _serve_goaway(
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+) -> None:
+    conn = h2.connection.H2Connection(
+        config=h2.config.H2Configuration(client_side=False)
+    )
+    conn.initiate_connection()
+    writer.write(conn.data_to_send())
+    terminated = False
+    while True:
+        data = await reader.read(65536)
+        if not data:
+            break
+        if terminated:
+            # Hold the connection open until the client closes it.
+            continue
+        for event in conn.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                conn.close_connection()
+                terminated = True
+        writer.write(conn.data_to_send())
+        await writer.drain()
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_h2_connection_terminated():
+    """Test a GOAWAY disconnects the open stream"""
+    server = await asyncio.start_server(_serve_goaway, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    http_protocol = H2Protocol(reader, writer)
+    await http_protocol.send(
+        {
+            'type': 'http.request',
+            'host': f'127.0.0.1:{port}',
+            'scheme': 'http',
+            'path': '/',
+            'method': 'GET',
+            'headers': [],
+            'body': None,
+            'more_body': False
+        }
+    )
+    message = await http_protocol.receive()
+    assert message['type'] == 'http.response.connection'
+    message = await asyncio.wait_for(http_protocol.receive(), 5)
+    assert message == {'type': 'http.disconnect', 'stream_id': 1}
+    assert not http_protocol.is_reusable
+    await http_protocol.send({'type': 'http.disconnect', 'stream_id': 1})
+
+    server.close()
+    await server.wait_closed()
+
+
+# A GOAWAY frame must be sent on stream 0, so this one is a protocol error.
+_MALFORMED_GOAWAY_FRAME = (
+    b'\x00\x00\x08'  # length
+    b'\x07'  # type
+    b'\x00'  # flags
+    b'\x00\x00\x00\x01'  # stream id
+    b'\x00\x00\x00\x00'  # last stream id
+    b'\x00\x00\x00\x00'  # error code
+)
+
+
+async def _serve_malformed_frame(
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+) -> None:
+    conn = h2.connection.H2Connection(
+        config=h2.config.H2Configuration(client_side=False)
+    )
+    conn.initiate_connection()
+    writer.write(conn.data_to_send())
+    sent = False
+    while True:
+        data = await reader.read(65536)
+        if not data:
+            break
+        if sent:
+            continue
+        for event in conn.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                sent = True
+        writer.write(conn.data_to_send())
+        if sent:
+            writer.write(_MALFORMED_GOAWAY_FRAME)
+        await writer.drain()
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_h2_malformed_frame():
+    """Test a protocol error disconnects the open stream and is raised"""
+    server = await asyncio.start_server(_serve_malformed_frame, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    http_protocol = H2Protocol(reader, writer)
+    await http_protocol.send(
+        {
+            'type': 'http.request',
+            'host': f'127.0.0.1:{port}',
+            'scheme': 'http',
+            'path': '/',
+            'method': 'GET',
+            'headers': [],
+            'body': None,
+            'more_body': False
+        }
+    )
+    message = await http_protocol.receive()
+    assert message['type'] == 'http.response.connection'
+    message = await asyncio.wait_for(http_protocol.receive(), 5)
+    assert message == {'type': 'http.disconnect', 'stream_id': 1}
+    with pytest.raises(h2.exceptions.ProtocolError):
+        await asyncio.wait_for(http_protocol.receive(), 5)
+    with pytest.raises(h2.exceptions.ProtocolError):
+        await asyncio.wait_for(
+            http_protocol.send({'type': 'http.disconnect', 'stream_id': 1}),
+            5
+        )
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_h2_connection_terminated_while_sending():
+    """Test a GOAWAY stops a request blocked on flow control"""
+    server = await asyncio.start_server(_serve_goaway, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    http_protocol = H2Protocol(reader, writer)
+    # The body is larger than the initial flow control window, which the
+    # server never opens.
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(
+            http_protocol.send(
+                {
+                    'type': 'http.request',
+                    'host': f'127.0.0.1:{port}',
+                    'scheme': 'http',
+                    'path': '/',
+                    'method': 'POST',
+                    'headers': [],
+                    'body': b'x' * 1024 * 1024,
+                    'more_body': False
+                }
+            ),
+            5
+        )
+    await http_protocol.send({'type': 'http.disconnect', 'stream_id': 1})
+
+    server.close()
+    await server.wait_closed()
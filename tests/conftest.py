@@ -0,0 +1,120 @@
+"""Shared test fixtures"""
+
+import asyncio
+import socket
+import struct
+from contextlib import asynccontextmanager
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Tuple
+)
+
+import h11
+import pytest
+
+H11Responder = Callable[[h11.Request, bytes], Awaitable[Tuple[int, bytes]]]
+H11DataCallback = Callable[[bytes], None]
+
+
+class H11Server:
+    """A local HTTP/1.1 server for tests"""
+
+    def __init__(
+            self,
+            respond: H11Responder,
+            keep_alive: bool,
+            reset: bool,
+            on_data: Optional[H11DataCallback]
+    ) -> None:
+        self.respond = respond
+        self.keep_alive = keep_alive
+        self.reset = reset
+        self.on_data = on_data
+        self.connections: List[asyncio.StreamWriter] = []
+        self.port = 0
+
+    async def serve(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve a connection"""
+        self.connections.append(writer)
+        conn = h11.Connection(our_role=h11.SERVER)
+        request: Optional[h11.Request] = None
+        body = b''
+        while True:
+            event = conn.next_event()
+            if event is h11.NEED_DATA:
+                conn.receive_data(await reader.read(65536))
+            elif isinstance(event, h11.Request):
+                request, body = event, b''
+            elif isinstance(event, h11.Data):
+                body += event.data
+                if self.on_data is not None:
+                    self.on_data(event.data)
+            elif isinstance(event, h11.EndOfMessage):
+                assert request is not None
+                status_code, content = await self.respond(request, body)
+                writer.write(conn.send(h11.Response(
+                    status_code=status_code,
+                    headers=[(b'content-length', str(len(content)).encode())]
+                )))
+                writer.write(conn.send(h11.Data(data=content)))
+                writer.write(conn.send(h11.EndOfMessage()))
+                await writer.drain()
+                if not self.keep_alive:
+                    # Close without telling the client, as an idle keep
+                    # alive connection would be closed.
+                    break
+                conn.start_next_cycle()
+            else:
+                break
+        if self.reset:
+            # Reset the connection rather than closing it cleanly.
+            writer.get_extra_info('socket').setsockopt(
+                socket.SOL_SOCKET,
+                socket.SO_LINGER,
+                struct.pack('ii', 1, 0)
+            )
+            writer.transport.abort()
+        else:
+            writer.close()
+
+
+async def _echo(request: h11.Request, body: bytes) -> Tuple[int, bytes]:
+    return 200, body or request.target
+
+
+@asynccontextmanager
+async def _start_h11_server(
+        respond: H11Responder = _echo,
+        *,
+        keep_alive: bool = True,
+        reset: bool = False,
+        on_data: Optional[H11DataCallback] = None
+) -> AsyncIterator[H11Server]:
+    test_server = H11Server(respond, keep_alive, reset, on_data)
+    server = await asyncio.start_server(test_server.serve, '127.0.0.1', 0)
+    test_server.port = server.sockets[0].getsockname()[1]
+    try:
+        yield test_server
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.fixture
+def h11_server():
+    """Start a local HTTP/1.1 server.
+
+    The fixture is an async context manager taking an optional responder,
+    which defaults to echoing the request body, or the target when there is
+    no body. Without keep alive the server closes the connection after each
+    response, resetting it when reset is set.
+    """
+    return _start_h11_server
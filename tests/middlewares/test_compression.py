@@ -0,0 +1,23 @@
+"""Tests for compression.py"""
+
+from bareclient.middlewares.compression import (
+    DEFAULT_DECOMPRESSORS,
+    _find_factory
+)
+
+
+def test_find_factory():
+    """Tests for finding the decompressor for a content encoding"""
+    assert _find_factory([], DEFAULT_DECOMPRESSORS) is None
+    assert _find_factory(
+        [(b'content-encoding', b'gzip')],
+        DEFAULT_DECOMPRESSORS
+    ) is DEFAULT_DECOMPRESSORS[b'gzip']
+    assert _find_factory(
+        [(b'content-encoding', b'br, deflate')],
+        DEFAULT_DECOMPRESSORS
+    ) is DEFAULT_DECOMPRESSORS[b'deflate']
+    assert _find_factory(
+        [(b'content-encoding', b'br')],
+        DEFAULT_DECOMPRESSORS
+    ) is None
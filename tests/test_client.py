@@ -0,0 +1,78 @@
+"""Tests for client.py"""
+
+import asyncio
+import socket
+import struct
+
+import pytest
+
+from bareclient import HttpClient
+
+
+@pytest.mark.asyncio
+async def test_request_body_is_streamed(h11_server):
+    """Test the request body is sent as it is produced"""
+    first_chunk_received = asyncio.Event()
+
+    async def producer():
+        yield b'one'
+        yield b'two'
+        # The first chunk must be on the wire before the body is complete.
+        await asyncio.wait_for(first_chunk_received.wait(), 5)
+        yield b'three'
+
+    async with h11_server(
+            on_data=lambda data: first_chunk_received.set()
+    ) as server:
+        async with HttpClient(
+                f'http://127.0.0.1:{server.port}/echo',
+                method='POST',
+                body=producer()
+        ) as response:
+            assert response.status == 200
+            assert await response.raw() == b'onetwothree'
+
+
+@pytest.mark.asyncio
+async def test_upload_fails_when_peer_aborts():
+    """Test an upload stops when the server resets the connection"""
+
+    async def serve(
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter
+    ) -> None:
+        await reader.read(4096)
+        # Reset the connection rather than closing it cleanly.
+        sock = writer.get_extra_info('socket')
+        sock.setsockopt(
+            socket.SOL_SOCKET,
+            socket.SO_LINGER,
+            struct.pack('ii', 1, 0)
+        )
+        writer.transport.abort()
+
+    chunks_produced = 0
+
+    async def producer():
+        nonlocal chunks_produced
+        for _ in range(2000):
+            chunks_produced += 1
+            yield b'x' * 1024
+            await asyncio.sleep(0)
+
+    server = await asyncio.start_server(serve, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(
+            HttpClient(
+                f'http://127.0.0.1:{port}/upload',
+                method='POST',
+                body=producer()
+            ).__aenter__(),
+            5
+        )
+    assert chunks_produced < 2000
+
+    server.close()
+    await server.wait_closed()
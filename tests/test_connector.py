@@ -0,0 +1,23 @@
+"""Tests for connector.py"""
+
+from bareclient.config import HttpClientConfig
+from bareclient.connector import get_ssl_context
+
+
+def test_ssl_context_is_shared():
+    """Test configs with the same trust anchors share a context"""
+    first = get_ssl_context(HttpClientConfig())
+    second = get_ssl_context(HttpClientConfig())
+    assert first is second
+
+    other = get_ssl_context(HttpClientConfig(alpn_protocols=('http/1.1',)))
+    assert other is not first
+
+
+def test_config_ssl_context_is_not_shared():
+    """Test the context of a config is its own, and is used to connect"""
+    config = HttpClientConfig()
+    ssl_context = config.ssl_context
+    assert ssl_context is not HttpClientConfig().ssl_context
+    assert ssl_context is not get_ssl_context(HttpClientConfig())
+    assert get_ssl_context(config) is ssl_context
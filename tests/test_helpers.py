@@ -0,0 +1,70 @@
+"""Tests for helpers.py"""
+
+import asyncio
+import json
+from typing import Tuple
+
+import h11
+import pytest
+
+from bareclient import HttpClientError, gather_json
+
+
+@pytest.mark.asyncio
+async def test_gather_json(h11_server):
+    """Test concurrent requests are bounded and returned in order"""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def respond(request: h11.Request, _body: bytes) -> Tuple[int, bytes]:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # Hold the request open so others could overlap with it.
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return 200, json.dumps({'path': request.target.decode()}).encode()
+
+    async with h11_server(respond, keep_alive=False) as server:
+        paths = [f'/{i}' for i in range(6)]
+        objs = await gather_json(
+            [f'http://127.0.0.1:{server.port}{path}' for path in paths],
+            max_concurrency=2
+        )
+        assert objs == [{'path': path} for path in paths]
+        assert max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_gather_json_failure_cancels_requests(h11_server):
+    """Test a failed request cancels those still in flight"""
+
+    async def respond(request: h11.Request, _body: bytes) -> Tuple[int, bytes]:
+        if request.target == b'/fail':
+            return 500, b''
+        await asyncio.sleep(10)
+        return 200, b'{}'
+
+    async with h11_server(respond, keep_alive=False) as server:
+        with pytest.raises(HttpClientError):
+            await asyncio.wait_for(
+                gather_json(
+                    [
+                        f'http://127.0.0.1:{server.port}/slow',
+                        f'http://127.0.0.1:{server.port}/fail'
+                    ]
+                ),
+                5
+            )
+        assert not [
+            task
+            for task in asyncio.all_tasks()
+            if task.get_coro().__qualname__ == 'gather_json.<locals>.fetch'
+        ]
+
+
+@pytest.mark.asyncio
+async def test_gather_json_invalid_concurrency():
+    """Test a concurrency limit below one is rejected"""
+    with pytest.raises(ValueError):
+        await gather_json(['http://127.0.0.1/'], max_concurrency=0)
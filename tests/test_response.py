@@ -0,0 +1,28 @@
+"""Tests for response.py"""
+
+import pytest
+
+from bareclient.response import Response
+
+
+async def _parts():
+    yield b'{"text": '
+    yield '"café'.encode('utf-8')[:-1]
+    yield '"café'.encode('utf-8')[-1:]
+    yield b'"}'
+
+
+@pytest.mark.asyncio
+async def test_read_body():
+    """Test reading a body received in several parts"""
+    response = Response('http://example.com', 200, [], _parts())
+    assert await response.raw() == '{"text": "café"}'.encode('utf-8')
+
+    response = Response('http://example.com', 200, [], _parts())
+    assert await response.text() == '{"text": "café"}'
+
+    response = Response('http://example.com', 200, [], _parts())
+    assert await response.json() == {'text': 'café'}
+
+    response = Response('http://example.com', 204, [], None)
+    assert await response.raw() is None
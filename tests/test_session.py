@@ -0,0 +1,62 @@
+"""Tests for session.py"""
+
+import asyncio
+
+import pytest
+
+from bareclient import HttpSession
+
+
+@pytest.mark.asyncio
+async def test_session_reuses_connection(h11_server):
+    """Test a session sends its requests on a single connection"""
+    async with h11_server() as server:
+        async with HttpSession(
+                'http',
+                '127.0.0.1',
+                port=server.port
+        ) as session:
+            for path in ('/one', '/two', '/three'):
+                response = await session.request(path)
+                assert response.status == 200
+                assert await response.text() == path
+
+        assert len(server.connections) == 1
+
+
+@pytest.mark.asyncio
+async def test_session_reconnects_when_server_closes(h11_server):
+    """Test a session reconnects when the server closes an idle connection"""
+    async with h11_server(keep_alive=False) as server:
+        async with HttpSession(
+                'http',
+                '127.0.0.1',
+                port=server.port
+        ) as session:
+            for path in ('/one', '/two'):
+                response = await session.request(path)
+                assert response.status == 200
+                assert await response.text() == path
+                # Give the server time to close the connection.
+                await asyncio.sleep(0.1)
+
+        assert len(server.connections) == 2
+
+
+@pytest.mark.asyncio
+async def test_session_reconnects_when_server_resets(h11_server):
+    """Test a session reconnects when the server resets an idle connection"""
+    async with h11_server(keep_alive=False, reset=True) as server:
+        async with HttpSession(
+                'http',
+                '127.0.0.1',
+                port=server.port
+        ) as session:
+            for path in ('/one', '/two'):
+                response = await session.request(path)
+                assert response.status == 200
+                assert await response.text() == path
+                # Give the server time to reset the connection.
+                await asyncio.sleep(0.1)
+
+        assert len(server.connections) == 2